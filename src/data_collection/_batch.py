@@ -0,0 +1,97 @@
+"""
+Batches of scrape tasks with bounded concurrency.
+
+Items run in a fixed number of slots, pages whose host is ready first, and
+results come back in input order.
+"""
+
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+from _rate_limit import DomainRateLimiter
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Worker slots of the run_batch() the current task belongs to (None outside one)
+_current_slots: contextvars.ContextVar[Optional[asyncio.Semaphore]] = \
+    contextvars.ContextVar('_current_slots', default=None)
+
+
+async def run_batch(items: Sequence[T], handle: Callable[[T], Awaitable[R]], concurrency: int,
+                    ready_in: Optional[Callable[[T], float]] = None) -> List:
+    """
+    Run handle(item) for every item with at most `concurrency` running at once.
+
+    The scrapers' batch functions are built on this, and are the seam for a
+    future Playwright MCP implementation: one batch of URLs in, one list of
+    results out, so a single navigate-and-extract call can replace a batch.
+
+    Handlers that must wait out a host's delay part-way through (e.g. before
+    a second request to the same site) should wait with acquire_outside_slot(),
+    which hands their slot to the next item for the duration of the wait.
+
+    Args:
+        items: Items to process
+        handle: Coroutine function processing one item
+        concurrency: Number of worker slots
+        ready_in: Optional function returning how long an item would have to
+            wait before its request may go out (e.g. DomainRateLimiter.ready_in
+            for the item's URL). A free slot takes the first pending item
+            that is ready now, or else the one that is ready soonest, so hosts
+            waiting out their delay do not hold slots while others are ready.
+
+    Returns:
+        One entry per item, in input order: the handler's result, or the
+        exception it raised.
+    """
+    results: List = [None] * len(items)
+    pending = list(range(len(items)))
+    slots = asyncio.Semaphore(concurrency)
+
+    def next_index() -> int:
+        if ready_in is None:
+            return pending.pop(0)
+
+        best, best_wait = 0, None
+        for position, index in enumerate(pending):
+            wait = ready_in(items[index])
+            if wait <= 0:
+                best = position
+                break
+            if best_wait is None or wait < best_wait:
+                best, best_wait = position, wait
+        return pending.pop(best)
+
+    async def run_one():
+        _current_slots.set(slots)
+        async with slots:
+            # The item is chosen only once a slot is free, and synchronously,
+            # so no two tasks get the same one
+            index = next_index()
+            try:
+                results[index] = await handle(items[index])
+            except Exception as e:
+                results[index] = e
+
+    await asyncio.gather(*(run_one() for _ in items))
+    return results
+
+
+async def acquire_outside_slot(limiter: DomainRateLimiter, url: str):
+    """
+    Wait until a request to this URL's host is allowed, without holding a
+    run_batch() slot while waiting. Outside run_batch() this is limiter.acquire().
+    """
+    slots = _current_slots.get()
+    if slots is None or limiter.ready_in(url) <= 0:
+        await limiter.acquire(url)
+        return
+
+    slots.release()
+    try:
+        await limiter.acquire(url)
+    finally:
+        await slots.acquire()
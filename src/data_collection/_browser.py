@@ -0,0 +1,139 @@
+"""
+Playwright browser pool.
+
+One Chromium instance is launched per run (on first use, so runs that never
+need JavaScript rendering never start a browser), and one BrowserContext is
+kept per host so pages on the same site share cookies and connections. Only a
+new page is opened per URL.
+
+Dependencies:
+    pip install playwright
+    playwright install chromium
+"""
+
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from _batch import acquire_outside_slot
+from _page_cache import PageCache
+from _rate_limit import DomainRateLimiter
+
+
+# Navigation timeout for a single page, in milliseconds
+PAGE_TIMEOUT_MS = 20000
+
+# How long to wait for the network to go quiet after the DOM has loaded.
+# Pages with analytics or long-polling never go idle, so this is best effort.
+NETWORK_IDLE_TIMEOUT_MS = 5000
+
+
+class BrowserPool:
+    """
+    A single headless Chromium with one reusable context per host.
+
+    If a PageCache is given, rendered HTML is stored in it and pages rendered
+    within its TTL are served from disk without opening the browser. If a
+    DomainRateLimiter is given, each navigation waits for its host's delay;
+    pages served from the cache make no request and never wait.
+    """
+
+    def __init__(self, cache: Optional[PageCache] = None,
+                 limiter: Optional[DomainRateLimiter] = None):
+        self.cache = cache
+        self.limiter = limiter
+        self._playwright = None
+        self._launch_lock = asyncio.Lock()
+        self._launch_error: Optional[Exception] = None
+        self.browser = None
+        self.contexts: Dict[str, object] = {}
+
+    async def __aenter__(self) -> 'BrowserPool':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._playwright is None:
+            return
+        try:
+            if self.browser is not None:
+                await self.browser.close()
+        finally:
+            await self._playwright.stop()
+            self._playwright = None
+            self.browser = None
+
+    async def _ensure_browser(self):
+        """
+        Launch Chromium the first time a page is needed.
+
+        If the launch fails (e.g. `playwright install chromium` was never run),
+        the driver is stopped again and the error is re-raised for every later
+        page instead of starting a new driver each time.
+        """
+        async with self._launch_lock:
+            if self.browser is not None:
+                return
+            if self._launch_error is not None:
+                raise self._launch_error
+
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            try:
+                self.browser = await self._playwright.chromium.launch(headless=True)
+            except Exception as e:
+                await self._playwright.stop()
+                self._playwright = None
+                self._launch_error = e
+                raise
+
+    async def context_for(self, url: str):
+        """Return the BrowserContext for this URL's host, creating it on first use."""
+        netloc = urlparse(url).netloc
+        if netloc not in self.contexts:
+            await self._ensure_browser()
+            context = await self.browser.new_context()
+            # Another task may have created one while we were waiting
+            if netloc in self.contexts:
+                await context.close()
+            else:
+                self.contexts[netloc] = context
+        return self.contexts[netloc]
+
+    async def new_page(self, url: str):
+        """Open a new page in the context for this URL's host."""
+        context = await self.context_for(url)
+        return await context.new_page()
+
+    async def render(self, url: str) -> str:
+        """
+        Navigate to a URL, wait for JavaScript content to settle, and return the HTML.
+
+        If the network does not go idle within NETWORK_IDLE_TIMEOUT_MS, the
+        DOM as loaded so far is returned rather than failing the page.
+        """
+        if self.cache is not None:
+            html = self.cache.get_fresh(url)
+            if html is not None:
+                return html
+
+        if self.limiter is not None:
+            await acquire_outside_slot(self.limiter, url)
+
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        page = await self.new_page(url)
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=PAGE_TIMEOUT_MS)
+            try:
+                await page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT_MS)
+            except PlaywrightTimeoutError:
+                # Still busy (analytics, long-polling); use the DOM loaded so far
+                pass
+            html = await page.content()
+        finally:
+            await page.close()
+
+        if self.cache is not None:
+            self.cache.put(url, html)
+        return html
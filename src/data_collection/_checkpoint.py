@@ -0,0 +1,68 @@
+"""
+Append-only JSONL checkpoints for resuming interrupted runs.
+
+Each completed record is written as one JSON line and fsync'd immediately, so an
+interrupted run (even kill -9) loses at most the record being written. On
+restart the scripts load the checkpoint and skip work that already succeeded.
+"""
+
+import os
+from typing import Dict
+
+from _jsonio import dumps, loads
+
+
+class Checkpoint:
+    """JSONL checkpoint of completed records, keyed by one of their fields."""
+
+    def __init__(self, path: str, key: str = 'name'):
+        self.path = path
+        self.key = key
+        self._complete_size = 0
+        self.records: Dict[str, Dict] = self._load()
+        self._file = None
+
+    def _load(self) -> Dict[str, Dict]:
+        """Load existing records; later lines win over earlier ones."""
+        records = {}
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    if line.endswith(b"\n"):
+                        self._complete_size += len(line)
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # Partially written last line from an interrupted run
+                        continue
+                    records[record[self.key]] = record
+        except FileNotFoundError:
+            pass
+        return records
+
+    def __enter__(self) -> 'Checkpoint':
+        self._file = open(self.path, 'ab')
+        if self._file.tell() > self._complete_size:
+            # Drop the partial last line of an interrupted run, so the next
+            # record does not get appended onto it
+            self._file.truncate(self._complete_size)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._file.close()
+        self._file = None
+
+    def write(self, record: Dict):
+        """Append a completed record and flush it to disk."""
+        self._file.write(dumps(record) + b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.records[record[self.key]] = record
+
+    def compact(self):
+        """Rewrite the checkpoint with one line per key, dropping superseded records."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            for record in self.records.values():
+                f.write(dumps(record) + b"\n")
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,109 @@
+"""
+JSON input/output helpers.
+
+Uses orjson when installed (pip install orjson) and falls back to the stdlib
+json module otherwise. Files are read and written in binary mode, the form
+orjson works with directly.
+"""
+
+import functools
+import json
+import os
+from typing import BinaryIO, Dict, Iterable, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _default(obj):
+    """Serialize objects the JSON backends don't know natively (msgspec Structs)."""
+    if msgspec is not None and isinstance(obj, msgspec.Struct):
+        # Structs with a to_dict() (e.g. Faculty) control their own layout
+        to_dict = getattr(obj, 'to_dict', None)
+        return to_dict() if to_dict is not None else msgspec.to_builtins(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[bytes, str]):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize an object to JSON bytes (compact, or indented with pretty=True)."""
+    if msgspec is not None and isinstance(obj, msgspec.Struct):
+        # Fast path, unless the struct carries extra keys to flatten into the output
+        if not pretty and not getattr(obj, 'extra', None):
+            return msgspec.json.encode(obj)
+        obj = _default(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, default=_default, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, default=_default, separators=(',', ':'),
+                      ensure_ascii=False).encode('utf-8')
+
+
+def load(path: str):
+    """Read and parse a JSON file."""
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump(obj, f: BinaryIO, pretty: bool = False):
+    """Serialize an object to a file opened in binary mode ('wb')."""
+    f.write(dumps(obj, pretty=pretty))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int) -> Dict:
+    return load(path)
+
+
+def load_json_cached(path: str) -> Dict:
+    """
+    Load a JSON file, reusing the parsed result until the file changes.
+
+    The cache is keyed on (path, modification time), so edits on disk are
+    picked up on the next call. The returned object is shared between callers
+    and must not be mutated; copy it first if you need to modify it.
+    """
+    return _load_json(path, os.stat(path).st_mtime_ns)
+
+
+load_json_cached.cache_clear = _load_json.cache_clear
+
+
+def dump_roster(metadata: Dict, faculty: Iterable[Dict], output_path: str, pretty: bool = False):
+    """
+    Write a {'metadata': ..., 'faculty': [...]} roster file.
+
+    Records are serialized and written one at a time (one per line), so only a
+    single record's JSON text is held in memory at once. With pretty=True the
+    whole document is indented instead, which is easier to read but slower and
+    roughly three times larger.
+    """
+    if pretty:
+        with open(output_path, 'wb') as f:
+            dump({'metadata': metadata, 'faculty': list(faculty)}, f, pretty=True)
+        return
+
+    with open(output_path, 'wb') as f:
+        f.write(b'{"metadata":')
+        f.write(dumps(metadata))
+        f.write(b',"faculty":[')
+        first = True
+        for record in faculty:
+            f.write(b'\n' if first else b',\n')
+            f.write(dumps(record))
+            first = False
+        f.write(b'\n]}\n')
@@ -0,0 +1,92 @@
+"""
+On-disk cache of fetched and rendered HTML pages.
+
+Speeds up development re-runs: pages fetched within the TTL are read from disk
+instead of being downloaded (or rendered with Playwright) again. Each page is
+stored gzipped under {cache_dir}/{key[:2]}/{key}.html.gz, where key is the
+SHA-1 of the URL, with a .meta.json sidecar holding the ETag, Last-Modified
+and fetch time used for conditional GETs once the entry has expired.
+
+Delete the cache directory to force every page to be fetched again.
+"""
+
+import gzip
+import hashlib
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from _jsonio import dump, load
+
+
+DEFAULT_TTL = timedelta(days=7)
+
+
+class PageCache:
+    """Gzipped HTML pages keyed by URL, with freshness metadata."""
+
+    def __init__(self, cache_dir: str, ttl: timedelta = DEFAULT_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.html.gz', base + '.meta.json'
+
+    def get(self, url: str) -> Optional[Tuple[str, Dict]]:
+        """Return (html, metadata) for a cached page, or None if not cached."""
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = load(meta_path)
+            with gzip.open(body_path, 'rt', encoding='utf-8') as f:
+                return f.read(), meta
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+    def is_fresh(self, meta: Dict) -> bool:
+        """Whether a cached entry is younger than the TTL."""
+        fetched_at = datetime.fromisoformat(meta['fetched_at'])
+        return datetime.now() - fetched_at < self.ttl
+
+    def get_fresh(self, url: str) -> Optional[str]:
+        """Return cached HTML if it is within the TTL, else None."""
+        entry = self.get(url)
+        if entry is not None and self.is_fresh(entry[1]):
+            return entry[0]
+        return None
+
+    def put(self, url: str, html: str, etag: Optional[str] = None,
+            last_modified: Optional[str] = None):
+        """Store a page and its validators."""
+        body_path, meta_path = self._paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+
+        with gzip.open(body_path + '.tmp', 'wt', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(body_path + '.tmp', body_path)
+
+        self._write_meta(meta_path, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': datetime.now().isoformat()
+        })
+
+    def touch(self, url: str, meta: Dict):
+        """Mark a cached page as fresh again (e.g. after a 304 Not Modified)."""
+        _, meta_path = self._paths(url)
+        self._write_meta(meta_path, {**meta, 'fetched_at': datetime.now().isoformat()})
+
+    def invalidate(self, url: str):
+        """Drop a cached page (e.g. HTML that failed to yield an extraction)."""
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _write_meta(self, meta_path: str, meta: Dict):
+        with open(meta_path + '.tmp', 'wb') as f:
+            dump(meta, f)
+        os.replace(meta_path + '.tmp', meta_path)
@@ -0,0 +1,88 @@
+"""
+Per-host rate limiting.
+
+Requests to the same host are spaced out by a random delay, while requests to
+different hosts never wait on each other.
+"""
+
+import asyncio
+import random
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+from _jsonio import load
+
+
+DEFAULT_CONFIG_PATH = 'data/rate_limits.json'
+DEFAULT_DELAY = (1.0, 2.0)
+
+
+class DomainRateLimiter:
+    """Space out requests per host (netloc) by a random (min, max) delay."""
+
+    def __init__(self, default_delay: Tuple[float, float] = DEFAULT_DELAY,
+                 host_delays: Dict[str, Tuple[float, float]] = None):
+        self.default_delay = default_delay
+        self.host_delays = host_delays or {}
+        self.locks: Dict[str, asyncio.Lock] = {}
+        self.next_allowed_time: Dict[str, float] = {}
+
+    @classmethod
+    def from_config(cls, path: str = DEFAULT_CONFIG_PATH) -> 'DomainRateLimiter':
+        """
+        Build a limiter from a JSON config file.
+
+        Expected format:
+            {
+              "default": {"min_delay": 1, "max_delay": 2},
+              "hosts": {"engineering.vanderbilt.edu": {"min_delay": 2, "max_delay": 4}}
+            }
+
+        Falls back to the default 1-2s delay if the file does not exist.
+        """
+        try:
+            config = load(path)
+        except FileNotFoundError:
+            return cls()
+
+        default = config.get('default', {})
+        default_delay = (
+            default.get('min_delay', DEFAULT_DELAY[0]),
+            default.get('max_delay', DEFAULT_DELAY[1])
+        )
+        host_delays = {
+            host: (delays['min_delay'], delays['max_delay'])
+            for host, delays in config.get('hosts', {}).items()
+        }
+        return cls(default_delay, host_delays)
+
+    def delay_for(self, netloc: str) -> Tuple[float, float]:
+        """Return the (min, max) delay configured for a host."""
+        return self.host_delays.get(netloc, self.default_delay)
+
+    def ready_in(self, url: str) -> float:
+        """Seconds until a request to this URL's host would be allowed (0 if now)."""
+        netloc = urlparse(url).netloc
+        lock = self.locks.get(netloc)
+        if lock is not None and lock.locked():
+            # Another request to this host is already waiting its turn
+            return float('inf')
+        return max(0.0, self.next_allowed_time.get(netloc, 0.0) - time.monotonic())
+
+    async def acquire(self, url: str):
+        """
+        Wait until a request to this URL's host is allowed.
+
+        Call this immediately before sending the request: the host's next
+        delay is counted from the moment acquire() returns.
+        """
+        netloc = urlparse(url).netloc
+        lock = self.locks.setdefault(netloc, asyncio.Lock())
+
+        async with lock:
+            wait = self.next_allowed_time.get(netloc, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            min_delay, max_delay = self.delay_for(netloc)
+            self.next_allowed_time[netloc] = time.monotonic() + random.uniform(min_delay, max_delay)
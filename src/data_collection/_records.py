@@ -0,0 +1,100 @@
+"""
+Typed faculty records for the merged roster.
+
+Faculty is a msgspec.Struct (slots-backed, C-implemented), which takes far less
+memory per record than a dict with the same keys and encodes to JSON faster.
+Scrapers and the FIS data still produce plain dicts; convert them with
+Faculty.from_dict() and back to builtins only at the serialization boundary.
+
+Scraped records are free-form, so from_dict() never rejects one: keys that are
+not Faculty fields, and values that do not fit a field's type, are kept in the
+`extra` dict and written back out as top-level keys by to_dict().
+
+Dependencies:
+    pip install msgspec
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import msgspec
+
+
+class Faculty(msgspec.Struct, omit_defaults=True):
+    """One faculty member, merged from FIS data and/or web scraping."""
+
+    name: str
+
+    # FIS fields (Issue #16)
+    id: Optional[str] = None
+    person_id: Optional[int] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    middle_name: Optional[str] = None
+    title: Optional[str] = None
+    rank: Optional[str] = None
+    department: Optional[str] = None
+    department_code: Optional[str] = None
+    school: Optional[str] = None
+    college: Optional[str] = None
+    email: Optional[str] = None
+    gender: Optional[str] = None
+    tenure_status: Optional[str] = None
+    is_active: Optional[bool] = None
+    hire_date: Optional[str] = None
+    data_source: Optional[str] = None
+
+    # Web scraping fields (Issue #4)
+    phone: Optional[str] = None
+    office: Optional[str] = None
+    website: Optional[str] = None
+    profile_url: Optional[str] = None
+    photo_url: Optional[str] = None
+    research_interests: Optional[List[str]] = None
+    category: Optional[str] = None
+    source_url: Optional[str] = None
+
+    # Merge bookkeeping
+    data_sources: Optional[Tuple[str, ...]] = None
+    fis_match: Optional[bool] = None
+    web_match: Optional[bool] = None
+
+    # Keys that are not fields above, or whose values did not fit the field type
+    extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, record: Dict) -> 'Faculty':
+        """Build a Faculty from a raw scraper or FIS dict; unknown or ill-typed values go to `extra`."""
+        known = {}
+        extra = {}
+        for key, value in record.items():
+            (known if key in _FIELD_TYPES else extra)[key] = value
+
+        try:
+            faculty = msgspec.convert(known, cls)
+        except msgspec.ValidationError:
+            # Keep every field that does validate and set the rest aside
+            faculty = cls(name=str(known.get('name', '')))
+            for key, value in known.items():
+                try:
+                    setattr(faculty, key, msgspec.convert(value, _FIELD_TYPES[key]))
+                except msgspec.ValidationError as e:
+                    print(f"Warning: keeping {key!r} of {faculty.name!r} as extra: {e}")
+                    extra[key] = value
+
+        if extra:
+            faculty.extra = extra
+        return faculty
+
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict, omitting fields that are unset and flattening `extra`."""
+        record = msgspec.to_builtins(self)
+        extra = record.pop('extra', None)
+        return {**record, **extra} if extra else record
+
+
+# Field name -> annotated type, used to validate fields one at a time
+_FIELD_TYPES = {
+    field.name: field.type
+    for field in msgspec.structs.fields(Faculty)
+    if field.name != 'extra'
+}
@@ -6,38 +6,75 @@ This script scrapes faculty information from Vanderbilt Engineering department p
 using Playwright to handle JavaScript-rendered content.
 
 Dependencies:
-    pip install playwright anthropic beautifulsoup4 lxml
+    pip install playwright anthropic beautifulsoup4 lxml msgspec
+
+Optional (faster JSON I/O):
+    pip install orjson
 
 Setup:
     playwright install chromium
 """
 
-import json
-import time
+import argparse
+import asyncio
+import os
+import sys
+import unicodedata
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from _batch import run_batch
+from _browser import BrowserPool
+from _checkpoint import Checkpoint
+from _page_cache import PageCache
+from _jsonio import dump_roster, load_json_cached
+from _rate_limit import DomainRateLimiter
+from _records import Faculty
+
+
+# Maximum number of department pages rendered at once (open browser pages)
+MAX_CONCURRENT_PAGES = 5
+
+# Departments handed to scrape_batch() at a time
+BATCH_SIZE = 10
+
+# Completed departments, so interrupted runs resume where they stopped
+CHECKPOINT_PATH = 'data/faculty_roster.checkpoint.jsonl'
+
+# On-disk cache of rendered department pages
+CACHE_DIR = 'cache'
+
+# String fields that repeat across many faculty records; interned so that all
+# records share one str object per distinct value
+INTERNED_FIELDS = ('department_code', 'department', 'school', 'college',
+                   'category', 'title', 'rank', 'tenure_status')
+
+# One shared tuple per distinct data_sources combination
+_DATA_SOURCES_CACHE: Dict[tuple, tuple] = {}
+
 
 def load_department_inventory() -> Dict:
-    """Load the department inventory created in Issue #3."""
-    with open('data/department_inventory.json', 'r') as f:
-        return json.load(f)
+    """Load the department inventory created in Issue #3 (cached; do not mutate)."""
+    return load_json_cached('data/department_inventory.json')
 
 
 def load_fis_faculty() -> Dict:
-    """Load the FIS faculty data created in Issue #16."""
-    with open('data/faculty_from_fis.json', 'r') as f:
-        return json.load(f)
+    """Load the FIS faculty data created in Issue #16 (cached; do not mutate)."""
+    return load_json_cached('data/faculty_from_fis.json')
 
 
-def scrape_faculty_page_playwright(url: str, department_code: str) -> List[Dict]:
+async def scrape_faculty_page_playwright(pool: BrowserPool, url: str, department_code: str) -> List[Dict]:
     """
     Scrape faculty listing page using Playwright MCP.
 
     This function will use the Playwright MCP server installed in Issue #1.
+    Each call opens a new page in the shared browser, reusing the context
+    (cookies, connections) of earlier pages on the same host.
 
     Args:
+        pool: Shared browser for this run
         url: URL of the faculty listing page
         department_code: Department code (e.g., 'bme', 'cs')
 
@@ -57,9 +94,11 @@ def scrape_faculty_page_playwright(url: str, department_code: str) -> List[Dict]
 
     print(f"[PLAYWRIGHT MCP] Navigate to: {url}")
     print(f"[PLAYWRIGHT MCP] Wait for JavaScript content to load")
+    html = await pool.render(url)
+
     print(f"[PLAYWRIGHT MCP] Extract faculty data")
 
-    # Expected data structure from Playwright scraping:
+    # Expected data structure parsed from the rendered `html`:
     faculty_data = []
 
     # Example of what should be extracted:
@@ -81,94 +120,176 @@ def scrape_faculty_page_playwright(url: str, department_code: str) -> List[Dict]
     return faculty_data
 
 
-def match_with_fis_data(scraped_faculty: List[Dict], fis_data: Dict) -> List[Dict]:
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for matching: accents folded to ASCII, lowercase, with
+    collapsed whitespace ("José  Núñez" -> "jose nunez").
+
+    Names with no ASCII letters at all are kept as-is rather than folded to ''.
+    """
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return ' '.join((folded if folded.strip() else name).split()).lower()
+
+
+def _intern_record(record: Faculty) -> Faculty:
+    """Deduplicate repeated string values and data_sources tuples in a record (in place)."""
+    for field in INTERNED_FIELDS:
+        value = getattr(record, field)
+        if value is not None:
+            setattr(record, field, sys.intern(value))
+
+    sources = record.data_sources
+    if sources is not None:
+        record.data_sources = _DATA_SOURCES_CACHE.setdefault(sources, sources)
+
+    return record
+
+
+def _merge_duplicate_listing(first: Dict, duplicate: Dict) -> Dict:
+    """
+    Combine two web records for the same person (e.g. a joint appointment listed
+    by two departments): values from the first listing win, gaps are filled from
+    the duplicate.
+    """
+    print(f"Warning: {first['name']} is listed more than once "
+          f"({first.get('department_code')}, {duplicate.get('department_code')}); "
+          f"merging the listings")
+    return {**duplicate, **{k: v for k, v in first.items() if v not in (None, '', [])}}
+
+
+def match_with_fis_data(scraped_faculty: List[Dict], fis_data: Dict) -> List[Faculty]:
     """
     Match scraped web data with FIS data to create enriched faculty records.
 
+    Names are compared after normalize_name(), so differences in case,
+    spacing or accents ("José  Smith" vs "jose smith") still match. A name
+    listed on more than one department page is merged into a single record
+    (with a warning). Repeated values (department, title, data_sources) are
+    shared across the returned records.
+
     Args:
         scraped_faculty: List of faculty from web scraping
         fis_data: FIS data from Issue #16
 
     Returns:
-        List of enriched faculty records
+        List of enriched Faculty records
     """
-    fis_faculty = {f['name']: f for f in fis_data['faculty']}
-    enriched = []
+    fis_by_name = {normalize_name(f['name']): f for f in fis_data['faculty']}
 
+    scraped_by_name = {}
     for web_faculty in scraped_faculty:
+        name = normalize_name(web_faculty['name'])
+        if name in scraped_by_name:
+            web_faculty = _merge_duplicate_listing(scraped_by_name[name], web_faculty)
+        scraped_by_name[name] = web_faculty
+
+    enriched = []
+    for name, web_faculty in scraped_by_name.items():
         # Try to match by name
-        fis_match = fis_faculty.get(web_faculty['name'])
+        fis_match = fis_by_name.get(name)
 
         if fis_match:
             # Merge FIS data with web data
-            merged = {**fis_match, **web_faculty}
-            merged['data_sources'] = ['FIS_All_Tenured_TT.xlsx', 'web_scraping']
-            enriched.append(merged)
+            record = Faculty.from_dict({
+                **fis_match, **web_faculty,
+                'data_sources': ('FIS_All_Tenured_TT.xlsx', 'web_scraping')
+            })
         else:
             # Faculty found on web but not in FIS
-            web_faculty['data_sources'] = ['web_scraping']
-            web_faculty['fis_match'] = False
-            enriched.append(web_faculty)
+            record = Faculty.from_dict({
+                **web_faculty, 'data_sources': ('web_scraping',), 'fis_match': False
+            })
+        enriched.append(_intern_record(record))
 
     # Check for FIS faculty not found on web
-    scraped_names = {f['name'] for f in scraped_faculty}
-    for fis_name, fis_faculty in fis_faculty.items():
-        if fis_name not in scraped_names:
-            fis_faculty['web_match'] = False
-            enriched.append(fis_faculty)
+    for name, fis_record in fis_by_name.items():
+        if name not in scraped_by_name:
+            record = Faculty.from_dict({**fis_record, 'web_match': False})
+            enriched.append(_intern_record(record))
 
     return enriched
 
 
-def save_faculty_roster(faculty_data: List[Dict], output_path: str):
+def save_faculty_roster(faculty_data: List[Faculty], output_path: str, pretty: bool = False):
     """Save the enriched faculty roster."""
-    output = {
-        'metadata': {
-            'created_date': datetime.now().isoformat(),
-            'data_sources': ['FIS_All_Tenured_TT.xlsx', 'web_scraping'],
-            'total_faculty': len(faculty_data),
-            'issues': ['#16 - FIS Data', '#4 - Web Scraping']
-        },
-        'faculty': faculty_data
+    metadata = {
+        'created_date': datetime.now().isoformat(),
+        'data_sources': ['FIS_All_Tenured_TT.xlsx', 'web_scraping'],
+        'total_faculty': len(faculty_data),
+        'issues': ['#16 - FIS Data', '#4 - Web Scraping']
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+    dump_roster(metadata, faculty_data, output_path, pretty=pretty)
 
     print(f"\nSaved faculty roster to: {output_path}")
 
 
-def generate_summary_report(faculty_data: List[Dict]) -> str:
+def generate_summary_report(faculty_data: List[Faculty]) -> str:
     """Generate a summary report of the scraping results."""
-    total = len(faculty_data)
-    with_websites = len([f for f in faculty_data if f.get('website')])
-    with_emails = len([f for f in faculty_data if f.get('email')])
-    fis_matches = len([f for f in faculty_data if f.get('data_sources', []) and 'FIS_All_Tenured_TT.xlsx' in f.get('data_sources', [])])
+    total = 0
+    with_websites = 0
+    with_emails = 0
+    fis_matches = 0
+    dept_counts = Counter()
+
+    # Tally all metrics in a single pass
+    for f in faculty_data:
+        total += 1
+        if f.website:
+            with_websites += 1
+        if f.email:
+            with_emails += 1
+        if f.data_sources and 'FIS_All_Tenured_TT.xlsx' in f.data_sources:
+            fis_matches += 1
+        dept_counts[f.department_code or 'unknown'] += 1
+
+    website_rate = (with_websites / total * 100) if total > 0 else 0
+    email_rate = (with_emails / total * 100) if total > 0 else 0
 
     report = f"""
 === Faculty Scraping Summary ===
 
 Total Faculty: {total}
 FIS Matches: {fis_matches}
-With Websites: {with_websites} ({with_websites/total*100:.1f}%)
-With Emails: {with_emails} ({with_emails/total*100:.1f}%)
+With Websites: {with_websites} ({website_rate:.1f}%)
+With Emails: {with_emails} ({email_rate:.1f}%)
 
 By Department:
 """
 
-    # Count by department
-    dept_counts = {}
-    for f in faculty_data:
-        dept = f.get('department_code', 'unknown')
-        dept_counts[dept] = dept_counts.get(dept, 0) + 1
-
     for dept, count in sorted(dept_counts.items()):
         report += f"  {dept}: {count}\n"
 
     return report
 
 
-def main():
+async def scrape_batch(pool: BrowserPool, targets: List[Tuple[str, str]]) -> List:
+    """
+    Scrape a batch of department listing pages in one browser.
+
+    Args:
+        pool: Shared browser pool (rate limits its own navigations)
+        targets: (faculty_list_url, department_code) pairs
+
+    Returns:
+        One entry per target, in input order: the list of faculty scraped from
+        the page, or the exception raised while scraping it.
+    """
+    async def scrape(target: Tuple[str, str]) -> List[Dict]:
+        url, department_code = target
+        print(f"URL: {url}")
+
+        # This would use Playwright MCP in actual execution
+        return await scrape_faculty_page_playwright(pool, url, department_code)
+
+    def ready_in(target: Tuple[str, str]) -> float:
+        # Prefer pages whose host is not waiting out its politeness delay
+        return pool.limiter.ready_in(target[0]) if pool.limiter is not None else 0.0
+
+    return await run_batch(targets, scrape, MAX_CONCURRENT_PAGES, ready_in=ready_in)
+
+
+async def main(pretty: bool = False):
     """Main scraping workflow for Issue #4."""
     print("=== Faculty Listing Scraper (Issue #4) ===\n")
 
@@ -179,33 +300,51 @@ def main():
     print(f"Loaded {len(dept_inventory['departments'])} departments")
     print(f"Loaded {fis_data['metadata']['total_faculty']} FIS faculty\n")
 
-    all_faculty = []
-
-    # Scrape each department
+    depts = []
     for dept in dept_inventory['departments']:
         if dept['faculty_list_url']:
-            print(f"\nProcessing: {dept['name']}")
-            print(f"URL: {dept['faculty_list_url']}")
-
-            # This would use Playwright MCP in actual execution
-            faculty = scrape_faculty_page_playwright(
-                dept['faculty_list_url'],
-                dept['id']
-            )
-
-            all_faculty.extend(faculty)
-
-            # Rate limiting - be respectful
-            time.sleep(2)
+            depts.append(dept)
         else:
             print(f"\nSkipping {dept['name']} - No faculty URL")
 
+    # Resume from departments completed in a previous run
+    checkpoint = Checkpoint(CHECKPOINT_PATH, key='department_id')
+    to_scrape = [d for d in depts if d['id'] not in checkpoint.records]
+    if len(to_scrape) < len(depts):
+        print(f"Resuming: {len(depts) - len(to_scrape)} departments already scraped")
+
+    # Scrape departments in batches; the browser pool rate limits each host
+    # (be respectful) and each batch is checkpointed as soon as it completes
+    rendered_cache = PageCache(os.path.join(CACHE_DIR, 'rendered'))
+    async with BrowserPool(rendered_cache, DomainRateLimiter.from_config()) as pool:
+        with checkpoint:
+            for i in range(0, len(to_scrape), BATCH_SIZE):
+                chunk = to_scrape[i:i + BATCH_SIZE]
+                for dept in chunk:
+                    print(f"\nProcessing: {dept['name']}")
+
+                results = await scrape_batch(
+                    pool, [(d['faculty_list_url'], d['id']) for d in chunk]
+                )
+
+                for dept, result in zip(chunk, results):
+                    if isinstance(result, Exception):
+                        print(f"Error processing {dept['name']}: {str(result)}")
+                    else:
+                        checkpoint.write({'department_id': dept['id'], 'faculty': result})
+
+    all_faculty = []
+    for dept in depts:
+        if dept['id'] in checkpoint.records:
+            all_faculty.extend(checkpoint.records[dept['id']]['faculty'])
+
     # Match with FIS data
     print("\n\nMatching with FIS data...")
     enriched_faculty = match_with_fis_data(all_faculty, fis_data)
 
     # Save results
-    save_faculty_roster(enriched_faculty, 'data/faculty_roster.json')
+    save_faculty_roster(enriched_faculty, 'data/faculty_roster.json', pretty=pretty)
+    checkpoint.compact()
 
     # Generate report
     report = generate_summary_report(enriched_faculty)
@@ -219,7 +358,11 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the output JSON (slower, larger files)')
+    args = parser.parse_args()
+    asyncio.run(main(pretty=args.pretty))
 
 
 # PLAYWRIGHT MCP USAGE NOTES:
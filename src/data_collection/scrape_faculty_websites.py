@@ -6,33 +6,105 @@ This script visits individual faculty websites to extract research descriptions,
 interests, publications, and lab information.
 
 Dependencies:
-    pip install playwright beautifulsoup4 lxml requests trafilatura
+    pip install playwright beautifulsoup4 lxml requests trafilatura 'httpx[http2]'
+
+Optional (faster):
+    pip install orjson pyahocorasick
 """
 
-import json
-import time
+import argparse
+import asyncio
+import contextlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
+from urllib.parse import urljoin
 import re
 
+from _batch import acquire_outside_slot, run_batch
+from _browser import BrowserPool
+from _checkpoint import Checkpoint
+from _page_cache import PageCache
+from _jsonio import dump_roster, load_json_cached
+from _rate_limit import DomainRateLimiter
+
+
+# Maximum number of faculty websites rendered at once (open browser pages)
+MAX_CONCURRENT_PAGES = 4
+
+# Faculty handed to process_batch() at a time
+BATCH_SIZE = 10
+
+# Completed extractions, so interrupted runs resume where they stopped
+CHECKPOINT_PATH = 'data/faculty_enriched.checkpoint.jsonl'
+
+# On-disk cache of fetched (static) and rendered (Playwright) pages
+CACHE_DIR = 'cache'
+
+# Static pages with less main text than this are re-rendered with Playwright
+MIN_STATIC_TEXT_LENGTH = 500
+
+# Root elements of JavaScript app shells that need rendering
+SPA_MARKERS = ('id="root"', 'id="app"', 'id="__next"', 'ng-app')
+
+# An opening <p> tag (not <path>, <pre> or <picture>)
+PARAGRAPH_TAG_RE = re.compile(r'<p[\s>]', re.IGNORECASE)
+
+# Research interests sections ("Research interests: a, b; c"), compiled once.
+# Each heading is scanned separately, so a heading inside another heading's
+# section ("interests include areas such as ...") still yields its own match.
+KEYWORD_SECTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r'research interests?:?\s*(.+?)(?:\n\n|\.|$)',
+        r'interests?:?\s*(.+?)(?:\n\n|\.|$)',
+        r'keywords?:?\s*(.+?)(?:\n\n|\.|$)',
+        r'areas?:?\s*(.+?)(?:\n\n|\.|$)',
+    )
+)
+KEYWORD_SPLIT_RE = re.compile(r'[,;•·\n]')
+
+# Keep at most this many keywords per page
+MAX_KEYWORDS = 20
+
+# Broad research areas and the terms that indicate them
+RESEARCH_CATEGORIES = {
+    'machine_learning': ['machine learning', 'deep learning', 'neural network', 'ai', 'artificial intelligence'],
+    'biomedical': ['biomedical', 'medical', 'clinical', 'health', 'disease'],
+    'robotics': ['robot', 'robotic', 'automation', 'autonomous'],
+    'materials': ['material', 'polymer', 'composite', 'nanomaterial'],
+    'energy': ['energy', 'renewable', 'solar', 'battery', 'fuel cell'],
+    'computing': ['computing', 'software', 'algorithm', 'data'],
+    'imaging': ['imaging', 'vision', 'image processing', 'visualization'],
+    'control': ['control', 'optimization', 'system'],
+}
+
+# Links to CV/resume PDFs (case-insensitive, single or double quoted href)
+CV_LINK_RE = re.compile(
+    r'href=["\']([^"\']*(?:cv|resume|vitae)[^"\']*\.pdf)["\']',
+    re.IGNORECASE
+)
+
 
 def load_faculty_roster() -> Dict:
-    """Load the faculty roster created in Issue #4."""
+    """Load the faculty roster created in Issue #4 (cached; do not mutate)."""
     try:
-        with open('data/faculty_roster.json', 'r') as f:
-            return json.load(f)
+        return load_json_cached('data/faculty_roster.json')
     except FileNotFoundError:
         # Fallback to FIS data if roster not yet created
-        with open('data/faculty_from_fis.json', 'r') as f:
-            return json.load(f)
+        return load_json_cached('data/faculty_from_fis.json')
 
 
-def extract_research_info_playwright(url: str, faculty_name: str) -> Dict:
+async def extract_research_info_playwright(pool: BrowserPool, parser: 'PageParser', url: str,
+                                           faculty_name: str) -> Dict:
     """
     Extract research information from a faculty website using Playwright MCP.
 
     Args:
+        pool: Shared browser for this run
+        parser: Process pool used to parse the rendered HTML
         url: URL of faculty personal/lab website
         faculty_name: Name of faculty member (for validation)
 
@@ -45,44 +117,147 @@ def extract_research_info_playwright(url: str, faculty_name: str) -> Dict:
     """
 
     print(f"[PLAYWRIGHT MCP] Navigating to: {url}")
+    html = await pool.render(url)
+
     print(f"[PLAYWRIGHT MCP] Extracting research content for: {faculty_name}")
+    return await parser.parse(html, url, 'playwright_mcp')
+
+
+def parse_research_page(html: str, url: str, extraction_method: str) -> Dict:
+    """
+    Parse research information out of a faculty page's HTML.
+
+    This is pure CPU work (trafilatura plus regexes), so it is defined at module
+    level and run in worker processes by PageParser.
+
+    Args:
+        html: Page HTML (static or rendered by Playwright)
+        url: URL the page was loaded from, for resolving relative links
+        extraction_method: How the HTML was obtained ('static_html' or 'playwright_mcp')
+
+    Returns:
+        Dictionary with extracted research information
+    """
+    text = extract_text_with_trafilatura(html)
+    keywords = extract_keywords_from_text(text)
 
-    # Placeholder for Playwright MCP interaction
     research_data = {
         'website_url': url,
-        'research_description': None,
-        'research_keywords': [],
-        'research_areas': [],
+        'research_description': text or None,
+        'research_keywords': keywords,
+        'research_areas': categorize_research_areas(keywords),
         'lab_name': None,
         'lab_website': None,
-        'cv_url': None,
+        'cv_url': extract_cv_links(html, url),
         'publications_listed': [],
         'courses_taught': [],
         'graduate_students': [],
         'funding_sources': [],
         'last_updated': None,
-        'extraction_success': False,
-        'extraction_method': 'playwright_mcp',
+        'extraction_success': bool(text),
+        'extraction_method': extraction_method,
         'extraction_date': datetime.now().isoformat()
     }
 
-    # Expected extraction tasks:
-    # 1. Find main research description (usually in <p> tags, specific divs)
-    # 2. Extract research interests/keywords (often bullet lists)
-    # 3. Look for lab/group name
-    # 4. Find CV/resume links (PDFs)
-    # 5. Extract publication lists if present
-    # 6. Note any course listings
-    # 7. Identify funding sources (NIH, NSF grants mentioned)
+    # Remaining extraction tasks:
+    # 1. Look for lab/group name
+    # 2. Extract publication lists if present
+    # 3. Note any course listings
+    # 4. Identify funding sources (NIH, NSF grants mentioned)
 
     return research_data
 
 
+class PageParser:
+    """
+    Run parse_research_page in a process pool.
+
+    Keeps regex-heavy parsing off the event loop, so other scrapes keep making
+    progress while a page is parsed. A semaphore bounds how many pages can be
+    queued for parsing at once, so large HTML blobs don't pile up in memory.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._queue_slots = asyncio.Semaphore(self.max_workers * 2)
+
+    def __enter__(self) -> 'PageParser':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.executor.shutdown()
+
+    async def parse(self, html: str, url: str, extraction_method: str) -> Dict:
+        """Parse a page in a worker process."""
+        loop = asyncio.get_running_loop()
+        async with self._queue_slots:
+            return await loop.run_in_executor(
+                self.executor, parse_research_page, html, url, extraction_method
+            )
+
+
+async def fetch_static(client, url: str, cache: Optional[PageCache] = None,
+                       limiter: Optional[DomainRateLimiter] = None) -> Optional[str]:
+    """
+    Fetch a page's HTML without a browser.
+
+    With a cache, pages fetched within its TTL are served from disk; expired
+    entries are revalidated with a conditional GET (ETag / Last-Modified).
+    With a limiter, requests that actually go out wait for their host's delay.
+
+    Returns None if httpx is unavailable, the request fails, or the response
+    is not an HTML page.
+    """
+    entry = cache.get(url) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry[1]):
+        return entry[0]
+
+    if client is None:
+        return None
+
+    headers = {}
+    if entry is not None:
+        if entry[1].get('etag'):
+            headers['If-None-Match'] = entry[1]['etag']
+        if entry[1].get('last_modified'):
+            headers['If-Modified-Since'] = entry[1]['last_modified']
+
+    if limiter is not None:
+        await acquire_outside_slot(limiter, url)
+
+    try:
+        response = await client.get(url, headers=headers)
+    except Exception as e:
+        print(f"  → Static fetch failed for {url}: {str(e)}")
+        return None
+
+    if response.status_code == 304 and entry is not None:
+        cache.touch(url, entry[1])
+        return entry[0]
+
+    if response.status_code != 200 or 'html' not in response.headers.get('content-type', ''):
+        return None
+
+    if cache is not None:
+        cache.put(url, response.text,
+                  etag=response.headers.get('etag'),
+                  last_modified=response.headers.get('last-modified'))
+    return response.text
+
+
+def _looks_like_spa(html: str) -> bool:
+    """Cheap check for JavaScript app shells whose content only appears after rendering."""
+    has_app_root = any(marker in html for marker in SPA_MARKERS)
+    return has_app_root and not PARAGRAPH_TAG_RE.search(html)
+
+
 def extract_text_with_trafilatura(html_content: str) -> str:
     """
     Extract main content from HTML using trafilatura library.
 
-    This is a backup method for pages that don't require JavaScript.
+    Used for pages that don't require JavaScript, and to pull the main text
+    out of pages rendered by Playwright.
     """
     try:
         import trafilatura
@@ -95,62 +270,58 @@ def extract_text_with_trafilatura(html_content: str) -> str:
 
 def extract_keywords_from_text(text: str) -> List[str]:
     """Extract research keywords from text using pattern matching."""
-    keywords = []
-
-    # Common patterns for research interests sections
-    patterns = [
-        r'research interests?:?\s*(.+?)(?:\n\n|\.|$)',
-        r'interests?:?\s*(.+?)(?:\n\n|\.|$)',
-        r'keywords?:?\s*(.+?)(?:\n\n|\.|$)',
-        r'areas?:?\s*(.+?)(?:\n\n|\.|$)',
+    # Split each research interests section by common delimiters
+    keywords = [
+        kw
+        for pattern in KEYWORD_SECTION_PATTERNS
+        for match in pattern.finditer(text)
+        for item in KEYWORD_SPLIT_RE.split(match.group(1))
+        if (kw := item.strip())
     ]
-
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
-        for match in matches:
-            content = match.group(1)
-            # Split by common delimiters
-            items = re.split(r'[,;•·\n]', content)
-            keywords.extend([item.strip() for item in items if item.strip()])
+    keywords_lower = [kw.lower() for kw in keywords]
 
     # Remove duplicates while preserving order
     seen = set()
     unique_keywords = []
-    for kw in keywords:
-        kw_lower = kw.lower()
+    for kw, kw_lower in zip(keywords, keywords_lower):
         if kw_lower not in seen and len(kw) > 2:
             seen.add(kw_lower)
             unique_keywords.append(kw)
+            if len(unique_keywords) == MAX_KEYWORDS:
+                break
 
-    return unique_keywords[:20]  # Limit to top 20
+    return unique_keywords
 
 
 def extract_cv_links(html_content: str, base_url: str) -> Optional[str]:
     """Find CV/resume PDF links in HTML."""
-    cv_patterns = [
-        r'href="([^"]*(?:cv|resume|vitae)[^"]*\.pdf)"',
-        r'href="([^"]*CV[^"]*\.pdf)"',
-    ]
-
-    for pattern in cv_patterns:
-        matches = re.finditer(pattern, html_content, re.IGNORECASE)
-        for match in matches:
-            cv_url = match.group(1)
-            # Make absolute URL if relative
-            if not cv_url.startswith('http'):
-                from urllib.parse import urljoin
-                cv_url = urljoin(base_url, cv_url)
-            return cv_url
+    match = CV_LINK_RE.search(html_content)
+    if not match:
+        return None
 
-    return None
+    cv_url = match.group(1)
+    # Make absolute URL if relative
+    if not cv_url.startswith('http'):
+        cv_url = urljoin(base_url, cv_url)
+    return cv_url
 
 
-def process_faculty_website(faculty: Dict) -> Dict:
+async def process_faculty_website(pool: BrowserPool, client, parser: PageParser, faculty: Dict,
+                                  checkpoint: Optional[Checkpoint] = None,
+                                  cache: Optional[PageCache] = None,
+                                  limiter: Optional[DomainRateLimiter] = None) -> Dict:
     """
     Process a single faculty member's website.
 
     Args:
+        pool: Shared browser for this run
+        client: Shared httpx.AsyncClient for static pages (None to always use Playwright)
+        parser: Process pool used to parse page HTML
         faculty: Faculty dictionary with at least 'website' and 'name'
+        checkpoint: Optional checkpoint to record the result in
+        cache: Optional on-disk cache for static pages
+        limiter: Optional per-host rate limiter for static fetches (the pool
+            rate limits its own navigations)
 
     Returns:
         Enriched faculty dictionary with research information
@@ -165,11 +336,28 @@ def process_faculty_website(faculty: Dict) -> Dict:
         }
 
     try:
-        # Use Playwright MCP to extract research info
-        research_info = extract_research_info_playwright(
-            faculty['website'],
-            faculty['name']
-        )
+        url = faculty['website']
+
+        # Most faculty pages are static HTML; only render with Playwright when
+        # the static page has too little text or is a JavaScript app shell
+        html = await fetch_static(client, url, cache, limiter)
+        research_info = None
+        if html and not _looks_like_spa(html):
+            research_info = await parser.parse(html, url, 'static_html')
+            if len(research_info['research_description'] or '') <= MIN_STATIC_TEXT_LENGTH:
+                research_info = None
+
+        if research_info is None:
+            # Use Playwright MCP to extract research info. This is a second
+            # request to the same host, so the pool waits out the host's delay
+            # again before navigating (unless the render is cached), giving up
+            # this item's batch slot while it waits
+            research_info = await extract_research_info_playwright(
+                pool,
+                parser,
+                url,
+                faculty['name']
+            )
 
         # Merge research info into faculty record
         enriched = {
@@ -177,11 +365,9 @@ def process_faculty_website(faculty: Dict) -> Dict:
             'website_data': research_info
         }
 
-        return enriched
-
     except Exception as e:
         print(f"Error processing {faculty['name']}: {str(e)}")
-        return {
+        enriched = {
             **faculty,
             'website_data': {
                 'extraction_success': False,
@@ -189,49 +375,86 @@ def process_faculty_website(faculty: Dict) -> Dict:
             }
         }
 
+    if checkpoint is not None:
+        checkpoint.write(enriched)
+
+    return enriched
+
+
+def _build_category_automaton():
+    """Build an Aho-Corasick automaton over all category terms, if pyahocorasick is installed."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for category, terms in RESEARCH_CATEGORIES.items():
+        for term in terms:
+            automaton.add_word(term, category)
+    automaton.make_automaton()
+    return automaton
+
+
+CATEGORY_AUTOMATON = _build_category_automaton()
+
 
 def categorize_research_areas(keywords: List[str]) -> List[str]:
     """Categorize research keywords into broad areas."""
-    categories = {
-        'machine_learning': ['machine learning', 'deep learning', 'neural network', 'ai', 'artificial intelligence'],
-        'biomedical': ['biomedical', 'medical', 'clinical', 'health', 'disease'],
-        'robotics': ['robot', 'robotic', 'automation', 'autonomous'],
-        'materials': ['material', 'polymer', 'composite', 'nanomaterial'],
-        'energy': ['energy', 'renewable', 'solar', 'battery', 'fuel cell'],
-        'computing': ['computing', 'software', 'algorithm', 'data'],
-        'imaging': ['imaging', 'vision', 'image processing', 'visualization'],
-        'control': ['control', 'optimization', 'system'],
-    }
-
-    identified = []
-    kw_lower = [k.lower() for k in keywords]
+    haystack = ' '.join(keywords).lower()
 
-    for category, terms in categories.items():
-        if any(term in ' '.join(kw_lower) for term in terms):
-            identified.append(category)
+    if CATEGORY_AUTOMATON is not None:
+        # Find every category term in one pass over the keywords
+        hits = {category for _, category in CATEGORY_AUTOMATON.iter(haystack)}
+        return [category for category in RESEARCH_CATEGORIES if category in hits]
 
-    return identified
+    return [
+        category for category, terms in RESEARCH_CATEGORIES.items()
+        if any(term in haystack for term in terms)
+    ]
 
 
 def generate_website_scraping_report(faculty_data: List[Dict]) -> str:
     """Generate summary report of website scraping."""
-    total = len(faculty_data)
-    with_websites = len([f for f in faculty_data if f.get('website')])
-    successful = len([f for f in faculty_data if f.get('website_data', {}).get('extraction_success')])
+    total = 0
+    with_websites = 0
+    successful = 0
+    with_descriptions = 0
+    with_keywords = 0
+    with_cv = 0
+    dept_stats = {}
 
-    with_descriptions = len([f for f in faculty_data
-                            if f.get('website_data', {}).get('research_description')])
-    with_keywords = len([f for f in faculty_data
-                        if f.get('website_data', {}).get('research_keywords')])
-    with_cv = len([f for f in faculty_data
-                  if f.get('website_data', {}).get('cv_url')])
+    # Tally overall and per-department metrics in a single pass
+    for f in faculty_data:
+        website_data = f.get('website_data', {})
+        dept = f.get('department_code', 'unknown')
+        if dept not in dept_stats:
+            dept_stats[dept] = {'total': 0, 'with_website': 0, 'extracted': 0}
+
+        total += 1
+        dept_stats[dept]['total'] += 1
+        if f.get('website'):
+            with_websites += 1
+            dept_stats[dept]['with_website'] += 1
+        if website_data.get('extraction_success'):
+            successful += 1
+            dept_stats[dept]['extracted'] += 1
+        if website_data.get('research_description'):
+            with_descriptions += 1
+        if website_data.get('research_keywords'):
+            with_keywords += 1
+        if website_data.get('cv_url'):
+            with_cv += 1
+
+    website_rate = (with_websites / total * 100) if total > 0 else 0
+    success_rate = (successful / with_websites * 100) if with_websites > 0 else 0
 
     report = f"""
 === Faculty Website Scraping Summary (Issue #5) ===
 
 Total Faculty: {total}
-With Website URLs: {with_websites} ({with_websites/total*100:.1f}%)
-Successful Extractions: {successful} ({successful/with_websites*100:.1f}% of those with websites)
+With Website URLs: {with_websites} ({website_rate:.1f}%)
+Successful Extractions: {successful} ({success_rate:.1f}% of those with websites)
 
 Content Extracted:
   Research Descriptions: {with_descriptions}
@@ -241,19 +464,6 @@ Content Extracted:
 Extraction Rate by Department:
 """
 
-    # Count by department
-    dept_stats = {}
-    for f in faculty_data:
-        dept = f.get('department_code', 'unknown')
-        if dept not in dept_stats:
-            dept_stats[dept] = {'total': 0, 'with_website': 0, 'extracted': 0}
-
-        dept_stats[dept]['total'] += 1
-        if f.get('website'):
-            dept_stats[dept]['with_website'] += 1
-        if f.get('website_data', {}).get('extraction_success'):
-            dept_stats[dept]['extracted'] += 1
-
     for dept, stats in sorted(dept_stats.items()):
         rate = (stats['extracted'] / stats['with_website'] * 100) if stats['with_website'] > 0 else 0
         report += f"  {dept}: {stats['extracted']}/{stats['with_website']} ({rate:.1f}%)\n"
@@ -261,29 +471,77 @@ Extraction Rate by Department:
     return report
 
 
-def save_enriched_roster(faculty_data: List[Dict], output_path: str):
+def save_enriched_roster(faculty_data: List[Dict], output_path: str, pretty: bool = False):
     """Save the enriched faculty roster with website data."""
-    output = {
-        'metadata': {
-            'created_date': datetime.now().isoformat(),
-            'data_sources': [
-                'FIS_All_Tenured_TT.xlsx',
-                'web_scraping_faculty_listings',
-                'web_scraping_faculty_websites'
-            ],
-            'total_faculty': len(faculty_data),
-            'issues': ['#16 - FIS Data', '#4 - Faculty Listings', '#5 - Faculty Websites']
-        },
-        'faculty': faculty_data
+    metadata = {
+        'created_date': datetime.now().isoformat(),
+        'data_sources': [
+            'FIS_All_Tenured_TT.xlsx',
+            'web_scraping_faculty_listings',
+            'web_scraping_faculty_websites'
+        ],
+        'total_faculty': len(faculty_data),
+        'issues': ['#16 - FIS Data', '#4 - Faculty Listings', '#5 - Faculty Websites']
     }
 
-    with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+    dump_roster(metadata, faculty_data, output_path, pretty=pretty)
 
     print(f"\nSaved enriched roster to: {output_path}")
 
 
-def main():
+@contextlib.asynccontextmanager
+async def open_static_client():
+    """Yield a shared HTTP/2 client for static pages, or None if httpx is not installed."""
+    try:
+        import httpx
+    except ImportError:
+        print("Warning: httpx not installed, rendering every page with Playwright. "
+              "Install with: pip install 'httpx[http2]'")
+        yield None
+        return
+
+    try:
+        client = httpx.AsyncClient(http2=True, follow_redirects=True, timeout=15)
+    except ImportError:
+        # h2 not installed; fall back to HTTP/1.1
+        client = httpx.AsyncClient(follow_redirects=True, timeout=15)
+
+    async with client:
+        yield client
+
+
+async def process_batch(pool: BrowserPool, client, parser: PageParser,
+                        limiter: DomainRateLimiter, faculty_batch: List[Dict],
+                        checkpoint: Optional[Checkpoint] = None,
+                        cache: Optional[PageCache] = None) -> List:
+    """
+    Process a batch of faculty websites in one browser.
+
+    Args:
+        pool: Shared browser pool
+        client: Shared httpx.AsyncClient for static pages (None to always use Playwright)
+        parser: Process pool used to parse page HTML
+        limiter: Per-host rate limiter for static fetches, also used to
+            schedule websites whose host is ready first
+        faculty_batch: Faculty dictionaries with at least 'website' and 'name'
+        checkpoint: Optional checkpoint to record each result in
+        cache: Optional on-disk cache for static pages
+
+    Returns:
+        One entry per faculty member, in input order: the enriched faculty
+        dictionary, or the exception raised while processing it.
+    """
+    async def process(faculty: Dict) -> Dict:
+        print(f"Processing: {faculty['name']}")
+        return await process_faculty_website(pool, client, parser, faculty,
+                                             checkpoint, cache, limiter)
+
+    # Prefer websites whose host is not waiting out its politeness delay
+    return await run_batch(faculty_batch, process, MAX_CONCURRENT_PAGES,
+                           ready_in=lambda faculty: limiter.ready_in(faculty['website']))
+
+
+async def main(pretty: bool = False):
     """Main workflow for Issue #5."""
     print("=== Faculty Website Scraper (Issue #5) ===\n")
 
@@ -297,23 +555,62 @@ def main():
     with_websites = [f for f in faculty_list if f.get('website')]
     print(f"Faculty with website URLs: {len(with_websites)}\n")
 
-    # Process each faculty website
+    # Resume from successful extractions in a previous run; failures are retried
+    checkpoint = Checkpoint(CHECKPOINT_PATH)
+    to_process = [
+        f for f in with_websites
+        if not checkpoint.records.get(f['name'], {}).get('website_data', {}).get('extraction_success')
+    ]
+    if len(to_process) < len(with_websites):
+        print(f"Resuming: {len(with_websites) - len(to_process)} faculty already extracted\n")
+
+    # Process faculty websites in batches, rate limited per host
+    static_cache = PageCache(os.path.join(CACHE_DIR, 'static'))
+    rendered_cache = PageCache(os.path.join(CACHE_DIR, 'rendered'))
+
+    # A retry must not re-read the HTML that failed last time
+    for faculty in to_process:
+        if faculty['name'] in checkpoint.records:
+            static_cache.invalidate(faculty['website'])
+            rendered_cache.invalidate(faculty['website'])
+
+    errors = {}
+    # One limiter for both paths, so static fetches and browser navigations
+    # to the same host are spaced out together
+    limiter = DomainRateLimiter.from_config()
+
+    async with BrowserPool(rendered_cache, limiter) as pool, open_static_client() as client:
+        with PageParser() as parser, checkpoint:
+            for i in range(0, len(to_process), BATCH_SIZE):
+                chunk = to_process[i:i + BATCH_SIZE]
+                results = await process_batch(pool, client, parser, limiter, chunk,
+                                              checkpoint, static_cache)
+
+                for faculty, result in zip(chunk, results):
+                    if isinstance(result, Exception):
+                        print(f"Error processing {faculty['name']}: {str(result)}")
+                        errors[faculty['name']] = {
+                            **faculty,
+                            'website_data': {
+                                'extraction_success': False,
+                                'error': str(result)
+                            }
+                        }
+
+    # Merge results back in original roster order; faculty without a
+    # website pass through unchanged
     enriched_faculty = []
-    for i, faculty in enumerate(faculty_list, 1):
-        print(f"[{i}/{len(faculty_list)}] Processing: {faculty['name']}")
-
-        if faculty.get('website'):
-            enriched = process_faculty_website(faculty)
-            enriched_faculty.append(enriched)
-
-            # Rate limiting - be respectful
-            time.sleep(3)
-        else:
-            print(f"  → No website URL, skipping")
+    for faculty in faculty_list:
+        if not faculty.get('website'):
             enriched_faculty.append(faculty)
+        elif faculty['name'] in errors:
+            enriched_faculty.append(errors[faculty['name']])
+        else:
+            enriched_faculty.append(checkpoint.records[faculty['name']])
 
     # Save enriched data
-    save_enriched_roster(enriched_faculty, 'data/faculty_enriched.json')
+    save_enriched_roster(enriched_faculty, 'data/faculty_enriched.json', pretty=pretty)
+    checkpoint.compact()
 
     # Generate report
     report = generate_website_scraping_report(enriched_faculty)
@@ -327,7 +624,11 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pretty', action='store_true',
+                        help='Indent the output JSON (slower, larger files)')
+    args = parser.parse_args()
+    asyncio.run(main(pretty=args.pretty))
 
 
 # PLAYWRIGHT MCP USAGE NOTES:
@@ -350,7 +651,7 @@ if __name__ == '__main__':
 #     Return as a structured dictionary"
 #
 # 4. The script will handle:
-#    - Rate limiting (3 second delays)
+#    - Rate limiting (per-host delays from data/rate_limits.json)
 #    - Error handling
 #    - Progress tracking
 #    - Data merging with existing faculty records
@@ -0,0 +1,71 @@
+"""
+Tests for the shared Playwright browser pool (src/data_collection/_browser.py).
+
+Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'data_collection'))
+
+try:
+    import playwright.async_api
+except ImportError:
+    playwright = None
+
+from _browser import BrowserPool
+
+
+@unittest.skipIf(playwright is None, 'playwright not installed')
+class BrowserPoolTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_exit_after_launch(self):
+        async with BrowserPool() as pool:
+            try:
+                await pool.context_for('https://example.com/')
+            except Exception as e:
+                self.skipTest(f'chromium not available: {e}')
+            self.assertIsNotNone(pool.browser)
+
+        self.assertIsNone(pool._playwright)
+        self.assertIsNone(pool.browser)
+
+    async def test_exit_after_launch_with_stub_browser(self):
+        # Real driver and Playwright object, stub Chromium (runs without browsers installed)
+        browser = mock.AsyncMock()
+        with mock.patch('playwright.async_api.BrowserType.launch', return_value=browser):
+            async with BrowserPool() as pool:
+                await pool._ensure_browser()
+                self.assertIs(pool.browser, browser)
+
+        browser.close.assert_awaited_once()
+        self.assertIsNone(pool._playwright)
+
+    async def test_failed_launch_starts_one_driver(self):
+        real_async_playwright = playwright.async_api.async_playwright
+        starts = []
+
+        def counting_async_playwright():
+            starts.append(1)
+            return real_async_playwright()
+
+        # An empty browsers directory makes chromium.launch() fail
+        with tempfile.TemporaryDirectory() as browsers_dir, \
+                mock.patch.dict(os.environ, {'PLAYWRIGHT_BROWSERS_PATH': browsers_dir}), \
+                mock.patch('playwright.async_api.async_playwright', counting_async_playwright):
+            async with BrowserPool() as pool:
+                for _ in range(3):
+                    with self.assertRaises(Exception):
+                        await pool.context_for('https://example.com/')
+                self.assertIsNone(pool._playwright)
+
+        self.assertEqual(len(starts), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()